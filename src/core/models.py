@@ -1,9 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, Dict, List, Optional
 from enum import Enum
-from datetime import datetime
+from functools import cached_property
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+def _utcnow() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
 class ModuleType(str, Enum):
     CHAT = "chat"
     TASKS = "tasks"
@@ -23,6 +27,8 @@ class EventType(str, Enum):
     INTELLIGENCE_RESPONSE = "intelligence_response"
 
 class ModuleRegistration(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     module_id: UUID = Field(default_factory=uuid4)
     name: str
     module_type: ModuleType
@@ -33,22 +39,36 @@ class ModuleRegistration(BaseModel):
     metadata: Dict[str, Any] = {}
 
 class IntelligenceEvent(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     event_id: UUID = Field(default_factory=uuid4)
     event_type: EventType
     source_module: UUID
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
     payload: Dict[str, Any]
     context: Dict[str, Any] = {}
 
+    @cached_property
+    def event_id_str(self) -> str:
+        return str(self.event_id)
+
+    @cached_property
+    def source_module_str(self) -> str:
+        return str(self.source_module)
+
 class ModuleResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     module_id: UUID
     module_name: str
     response: Dict[str, Any]
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 class IntelligenceResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     request_id: UUID
     original_event: IntelligenceEvent
     module_responses: List[ModuleResponse]
     core_insights: Dict[str, Any] = {}
-    timestamp: datetime = Field(default_factory=datetime.now)
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=_utcnow)
\ No newline at end of file
@@ -1,29 +1,90 @@
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 from uuid import UUID
+from collections import Counter, defaultdict
+from itertools import count
 import asyncio
+import logging
+import os
 
 from src.core.models import (
     ModuleRegistration, 
     IntelligenceEvent, 
     IntelligenceResponse,
     ModuleResponse,
-    EventType
+    EventType,
+    ModuleType
 )
 from src.events.bus import EventBus
 from src.shared.context import SharedContext
 
+logger = logging.getLogger(__name__)
+
+# Artificial per-handler delay for demos (SIM_LATENCY seconds). The default of 0
+# still yields to the event loop without scheduling a timer.
+SIMULATE_LATENCY_SEC = float(os.getenv("SIM_LATENCY", "0"))
+
+# Events the core itself emits or only needs to observe; processing them would
+# publish another INTELLIGENCE_RESPONSE and feed back into the core indefinitely
+_UNPROCESSED_EVENT_TYPES = frozenset({EventType.INTELLIGENCE_RESPONSE, EventType.MODULE_REGISTERED})
+
+# Capabilities that make a module relevant to each event type
+_RELEVANCE_MAP: Dict[EventType, frozenset] = {
+    EventType.TASK_CREATED: frozenset({"task_management", "automation", "analysis"}),
+    EventType.MESSAGE_RECEIVED: frozenset({"chat", "insights", "sentiment_analysis"}),
+    EventType.INSIGHT_GENERATED: frozenset({"insights", "knowledge_base", "analytics"}),
+    EventType.USER_ACTIVITY: frozenset({"analytics", "insights", "automation"}),
+}
+_EMPTY: frozenset = frozenset()
+
+# Mock response builders keyed by module type; each extends the shared base response
+_MOCK_BUILDERS: Dict[ModuleType, Callable[[Dict], Dict]] = {
+    ModuleType.CHAT: lambda base: {
+        **base,
+        "suggested_responses": ["I understand your request.", "Let me help with that."],
+        "sentiment": "positive",
+        "urgency": "medium"
+    },
+    ModuleType.TASKS: lambda base: {
+        **base,
+        "estimated_completion_time": "2 hours",
+        "priority": "high",
+        "dependencies": []
+    },
+    ModuleType.INSIGHTS: lambda base: {
+        **base,
+        "key_insights": ["Pattern detected in user behavior", "Opportunity for automation"],
+        "recommendations": ["Consider automating this workflow"],
+        "correlation_strength": 0.75
+    },
+}
+
 class CoreIntelligenceService:
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.registered_modules: Dict[UUID, ModuleRegistration] = {}
         self.shared_context = SharedContext()
         self.event_handlers = {}
+        self._capability_index: Dict[str, Set[UUID]] = defaultdict(set)
+        self._type_counts: Counter = Counter()
+        # Registration sequence per module id, so index lookups can restore registration order
+        self._registration_seq: Dict[UUID, int] = {}
+        self._next_registration_seq = count()
+        # Serialised registration per module id, updated one entry at a time as modules change
+        self._module_dumps: Dict[UUID, Dict[str, Any]] = {}
 
     async def initialize(self):
         """Initialize the core service and set up event handlers"""
         self._setup_event_handlers()
+        self.event_bus.subscribe_many(self.event_handlers)
+        # Batch delivery only pays off when the bus actually buffers events
+        batching = self.event_bus.batch_window is not None
         for event_type in EventType:
-            self.event_bus.subscribe(event_type, self._handle_incoming_event)
+            if event_type in _UNPROCESSED_EVENT_TYPES:
+                continue
+            if batching:
+                self.event_bus.subscribe_batch(event_type, self._handle_incoming_events)
+            else:
+                self.event_bus.subscribe(event_type, self._handle_incoming_event)
 
     def _setup_event_handlers(self):
         """Register event handlers for different event types"""
@@ -37,7 +98,15 @@ class CoreIntelligenceService:
 
     async def register_module(self, registration: ModuleRegistration) -> ModuleRegistration:
         """Register a new module with the core service"""
+        if registration.module_id in self.registered_modules:
+            self.unregister_module(registration.module_id)
+
         self.registered_modules[registration.module_id] = registration
+        self._type_counts[registration.module_type] += 1
+        for capability in registration.capabilities:
+            self._capability_index[capability].add(registration.module_id)
+        self._module_dumps[registration.module_id] = registration.model_dump()
+        self._registration_seq[registration.module_id] = next(self._next_registration_seq)
         
         event = IntelligenceEvent(
             event_type=EventType.MODULE_REGISTERED,
@@ -50,25 +119,54 @@ class CoreIntelligenceService:
         )
         
         await self.event_bus.publish(event)
-        print(f"Module registered: {registration.name} ({registration.module_type})")
+        logger.info("Module registered: %s (%s)", registration.name, registration.module_type)
+        return registration
+
+    def unregister_module(self, module_id: UUID) -> Optional[ModuleRegistration]:
+        """Remove a module and drop it from the capability index"""
+        registration = self.registered_modules.pop(module_id, None)
+        if registration is None:
+            return None
+
+        self._type_counts[registration.module_type] -= 1
+        for capability in registration.capabilities:
+            module_ids = self._capability_index.get(capability)
+            if module_ids is not None:
+                module_ids.discard(module_id)
+                if not module_ids:
+                    del self._capability_index[capability]
+        del self._module_dumps[module_id]
+        del self._registration_seq[module_id]
         return registration
 
+    def get_modules_snapshot(self) -> List[Dict[str, Any]]:
+        """Return the serialised registrations of every module, dumped once at registration"""
+        return list(self._module_dumps.values())
+
+    async def _handle_incoming_events(self, events: List[IntelligenceEvent]):
+        """Handle a batch of same-type events delivered by the event bus"""
+        await asyncio.gather(*(self._handle_incoming_event(event) for event in events))
+
     async def _handle_incoming_event(self, event: IntelligenceEvent):
         """Handle incoming events from the event bus"""
-        print(f"Core Service processing event: {event.event_type} from {event.source_module}")
+        if event.event_type in _UNPROCESSED_EVENT_TYPES:
+            return
+
+        logger.debug("Core Service processing event: %s from %s", event.event_type, event.source_module)
         
         self.shared_context.update_from_event(event)
         
         response = await self.process_event(event)
         
-        response_event = IntelligenceEvent(
+        # Internally produced, so skip re-validating the nested response
+        response_event = IntelligenceEvent.model_construct(
             event_type=EventType.INTELLIGENCE_RESPONSE,
             source_module=event.source_module,
-            payload=response.model_dump()
+            payload={"response": response}
         )
         await self.event_bus.publish(response_event)
         
-        print(f"Core Service completed processing event: {event.event_type}")
+        logger.debug("Core Service completed processing event: %s", event.event_type)
 
     async def process_event(self, event: IntelligenceEvent) -> IntelligenceResponse:
         """Process an incoming event and orchestrate module responses"""
@@ -87,53 +185,40 @@ class CoreIntelligenceService:
 
     def _get_relevant_modules(self, event: IntelligenceEvent) -> List[ModuleRegistration]:
         """Determine which modules should process this event"""
-        relevant_modules = []
-        
-        for module in self.registered_modules.values():
-            if self._is_module_relevant(module, event):
-                relevant_modules.append(module)
-        
-        return relevant_modules
-
-    def _is_module_relevant(self, module: ModuleRegistration, event: IntelligenceEvent) -> bool:
-        """Determine if a module is relevant for a given event"""
-        if module.module_id == event.source_module:
-            return False
-            
-        module_capabilities = set(module.capabilities)
-        
-        relevance_map = {
-            EventType.TASK_CREATED: {"task_management", "automation", "analysis"},
-            EventType.MESSAGE_RECEIVED: {"chat", "insights", "sentiment_analysis"},
-            EventType.INSIGHT_GENERATED: {"insights", "knowledge_base", "analytics"},
-            EventType.USER_ACTIVITY: {"analytics", "insights", "automation"},
-        }
-        
-        relevant_capabilities = relevance_map.get(event.event_type, set())
-        return bool(module_capabilities & relevant_capabilities)
+        relevant_capabilities = _RELEVANCE_MAP.get(event.event_type, _EMPTY)
+        capability_index = self._capability_index
+        registered_modules = self.registered_modules
+        module_ids = set().union(*(capability_index.get(c, ()) for c in relevant_capabilities))
+        if not module_ids:
+            return []
+        module_ids.discard(event.source_module)
+        # Sort only the matched ids so responses keep registration order without scanning the registry
+        ordered_ids = sorted(module_ids, key=self._registration_seq.__getitem__)
+        return [registered_modules[module_id] for module_id in ordered_ids]
 
     async def _orchestrate_module_processing(self, event: IntelligenceEvent, modules: List[ModuleRegistration]) -> List[ModuleResponse]:
         """Orchestrate parallel processing of event by relevant modules"""
-        tasks = []
-        for module in modules:
-            task = self._process_with_module(event, module)
-            tasks.append(task)
-        
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        successful_responses = []
-        for i, response in enumerate(responses):
-            if not isinstance(response, Exception):
-                successful_responses.append(response)
-            else:
-                print(f"Module {modules[i].name} failed: {response}")
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(self._process_with_module_safely(event, module))
+                for module in modules
+            ]
         
-        return successful_responses
+        responses = (task.result() for task in tasks)
+        return [response for response in responses if response is not None]
+
+    async def _process_with_module_safely(self, event: IntelligenceEvent, module: ModuleRegistration) -> Optional[ModuleResponse]:
+        """Process with a module, logging failures so they don't cancel the rest of the group"""
+        try:
+            return await self._process_with_module(event, module)
+        except Exception as e:
+            logger.warning("Module %s failed: %s", module.name, e, exc_info=e)
+            return None
 
     async def _process_with_module(self, event: IntelligenceEvent, module: ModuleRegistration) -> ModuleResponse:
         """Simulate processing an event with a specific module"""
         
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(SIMULATE_LATENCY_SEC)
         
         # Mock module intelligence based on module type
         mock_response = self._generate_mock_module_response(module, event)
@@ -149,51 +234,39 @@ class CoreIntelligenceService:
         base_response = {
             "processed": True,
             "confidence": 0.85,
-            "context_used": list(self.shared_context.get_relevant_context(event).keys())[:3]
+            "context_used": self.shared_context.get_relevant_context_fields(event, limit=3)
         }
         
-        if module.module_type.value == "chat":
-            return {
-                **base_response,
-                "suggested_responses": ["I understand your request.", "Let me help with that."],
-                "sentiment": "positive",
-                "urgency": "medium"
-            }
-        elif module.module_type.value == "tasks":
-            return {
-                **base_response,
-                "estimated_completion_time": "2 hours",
-                "priority": "high",
-                "dependencies": []
-            }
-        elif module.module_type.value == "insights":
-            return {
-                **base_response,
-                "key_insights": ["Pattern detected in user behavior", "Opportunity for automation"],
-                "recommendations": ["Consider automating this workflow"],
-                "correlation_strength": 0.75
-            }
-        
-        return base_response
+        builder = _MOCK_BUILDERS.get(module.module_type)
+        return builder(base_response) if builder else base_response
 
     async def _generate_core_insights(self, event: IntelligenceEvent, responses: List[ModuleResponse]) -> Dict:
         """Generate core insights by synthesizing module responses"""
         if not responses:
             return {"message": "No modules processed this event"}
         
-        all_insights = []
-        all_confidences = []
+        # First five unique insights, in the order modules reported them
+        synthesized_insights = []
+        seen_insights = set()
+        confidence_total = 0
+        confidence_count = 0
         
         for response in responses:
-            if "key_insights" in response.response:
-                all_insights.extend(response.response["key_insights"])
-            if "confidence" in response.response:
-                all_confidences.append(response.response["confidence"])
+            for insight in response.response.get("key_insights", ()):
+                if len(synthesized_insights) == 5:
+                    break
+                if insight not in seen_insights:
+                    seen_insights.add(insight)
+                    synthesized_insights.append(insight)
+            confidence = response.response.get("confidence")
+            if confidence is not None:
+                confidence_total += confidence
+                confidence_count += 1
         
-        avg_confidence = sum(all_confidences) / len(all_confidences) if all_confidences else 0
+        avg_confidence = confidence_total / confidence_count if confidence_count else 0
         
         return {
-            "synthesized_insights": list(set(all_insights))[:5],
+            "synthesized_insights": synthesized_insights,
             "average_confidence": round(avg_confidence, 2),
             "modules_engaged": len(responses),
             "consensus_level": "high" if avg_confidence > 0.7 else "medium",
@@ -201,19 +274,19 @@ class CoreIntelligenceService:
         }
 
     async def _handle_task_event(self, event: IntelligenceEvent):
-        print(f"Core handling task event: {event.event_type}")
+        logger.debug("Core handling task event: %s", event.event_type)
 
     async def _handle_message_event(self, event: IntelligenceEvent):
-        print(f"Core handling message event: {event.event_type}")
+        logger.debug("Core handling message event: %s", event.event_type)
 
     async def _handle_insight_event(self, event: IntelligenceEvent):
-        print(f"Core handling insight event: {event.event_type}")
+        logger.debug("Core handling insight event: %s", event.event_type)
 
     async def _handle_user_activity(self, event: IntelligenceEvent):
-        print(f"Core handling user activity: {event.event_type}")
+        logger.debug("Core handling user activity: %s", event.event_type)
 
     async def _handle_module_registration(self, event: IntelligenceEvent):
-        print(f"New module registered: {event.payload.get('module_name')}")
+        logger.debug("New module registered: %s", event.payload.get('module_name'))
     
 
     def get_module_stats(self) -> Dict:
@@ -221,12 +294,9 @@ class CoreIntelligenceService:
         return {
             "total_modules": len(self.registered_modules),
             "modules_by_type": {
-                module_type.value: len([m for m in self.registered_modules.values() if m.module_type == module_type])
-                for module_type in EventType
+                module_type.value: self._type_counts[module_type]
+                for module_type in ModuleType
             },
-            "active_capabilities": list(set(
-                capability 
-                for module in self.registered_modules.values() 
-                for capability in module.capabilities
-            ))
+            # The capability index drops a capability once no module provides it
+            "active_capabilities": list(self._capability_index)
         }
\ No newline at end of file
@@ -1,62 +1,218 @@
-from typing import Dict, List, Callable, Any
-from src.core.models import IntelligenceEvent
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Awaitable, Deque, Dict, List, Callable, Any, Optional, Set, Tuple, Union
+from collections import Counter, deque
+from itertools import islice
+from src.core.models import IntelligenceEvent, EventType
+
+logger = logging.getLogger(__name__)
+
+
+def _event_type_key(event_type: Union[EventType, str]) -> str:
+    """Normalize subscription keys to the plain string value used by publish"""
+    return event_type.value if isinstance(event_type, EventType) else event_type
+
+
+class FlushTimer:
+    """Starts an async flush once a delay has passed since the first item was buffered"""
+
+    def __init__(self, flush: Callable[[], Awaitable[Any]]):
+        self._flush = flush
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def active(self) -> bool:
+        """Whether a flush is scheduled or still running"""
+        return self._handle is not None or bool(self._tasks)
+
+    def schedule(self, delay: float):
+        """Arm the timer unless a flush is already scheduled"""
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(delay, self._start)
+
+    def cancel(self):
+        """Disarm the timer, typically because the caller is flushing right now"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    async def wait(self):
+        """Wait for flushes the timer has already started"""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _start(self):
+        self._handle = None
+        task = asyncio.create_task(self._flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+class _DispatchScope:
+    """Events published by subscribers during one top-level dispatch, delivered before it returns"""
+
+    __slots__ = ("bus", "pending", "open")
+
+    def __init__(self, bus: "EventBus"):
+        self.bus = bus
+        self.pending: Deque[Tuple[str, List[IntelligenceEvent]]] = deque()
+        self.open = True
+
+
+# Set for the task running a top-level dispatch and inherited by the subscriber tasks it spawns
+_dispatch_scope: ContextVar[Optional[_DispatchScope]] = ContextVar("event_bus_dispatch_scope", default=None)
 
 
 class EventBus:
     """Lightweight mock event bus for inter-module communication"""
     
-    def __init__(self):
+    def __init__(self, max_history: int = 1000, batch_window: Optional[float] = None):
         self.subscribers: Dict[str, List[Callable]] = {}
-        self.event_history: List[IntelligenceEvent] = []
-        self.max_history = 1000
+        self.batch_subscribers: Dict[str, List[Callable]] = {}
+        self.max_history = max_history
+        self.event_history: Deque[IntelligenceEvent] = deque(maxlen=max_history)
+        # Per-type counts of the events currently held in event_history
+        self._type_counter: Counter = Counter()
+        # When set, events are buffered for this many seconds and dispatched per type in one go
+        self.batch_window = batch_window
+        self._buffer: Dict[str, List[IntelligenceEvent]] = {}
+        self._flush_timer = FlushTimer(self.flush)
 
     async def publish(self, event: IntelligenceEvent):
         """Publish an event to all subscribers"""
-        print(f"Event published: {event.event_type} from {event.source_module}")
-        
-        self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
+        logger.debug("Event published: %s from %s", event.event_type, event.source_module)
         
         event_type = event.event_type.value
-        if event_type in self.subscribers:
-            for callback in self.subscribers[event_type]:
-                try:
-                    await callback(event)
-                except Exception as e:
-                    print(f"Error in event subscriber: {e}")
+        self._record(event, event_type)
+        await self._submit({event_type: [event]})
 
-    def subscribe(self, event_type: str, callback: Callable):
+    async def publish_many(self, events: List[IntelligenceEvent]):
+        """Publish several events at once, dispatching all events of a type together"""
+        logger.debug("Publishing %d events", len(events))
+
+        batches: Dict[str, List[IntelligenceEvent]] = {}
+        for event in events:
+            event_type = event.event_type.value
+            self._record(event, event_type)
+            batches.setdefault(event_type, []).append(event)
+        await self._submit(batches)
+
+    async def _submit(self, batches: Dict[str, List[IntelligenceEvent]]):
+        """Dispatch recorded events now, or buffer them for the next flush in batching mode"""
+        if self.batch_window is None:
+            scope = _dispatch_scope.get()
+            if scope is not None and scope.open and scope.bus is self:
+                # Published from inside a subscriber: the enclosing dispatch delivers it
+                scope.pending.extend(batches.items())
+            else:
+                await self._drain(batches)
+            return
+
+        for event_type, events in batches.items():
+            self._buffer.setdefault(event_type, []).extend(events)
+        self._flush_timer.schedule(self.batch_window)
+
+    async def _drain(self, batches: Dict[str, List[IntelligenceEvent]]):
+        """Dispatch a top-level publish, then whatever its subscribers published, without nesting"""
+        scope = _DispatchScope(self)
+        pending = scope.pending
+        pending.extend(batches.items())
+        token = _dispatch_scope.set(scope)
+        try:
+            while pending:
+                event_type, events = pending.popleft()
+                await self._dispatch(event_type, events)
+        finally:
+            scope.open = False
+            _dispatch_scope.reset(token)
+
+    def _record(self, event: IntelligenceEvent, event_type: str):
+        """Append to history, keeping per-type counts in step with deque eviction"""
+        history = self.event_history
+        if history and len(history) == history.maxlen:
+            evicted_type = history[0].event_type.value
+            self._type_counter[evicted_type] -= 1
+            if not self._type_counter[evicted_type]:
+                del self._type_counter[evicted_type]
+        history.append(event)
+        self._type_counter[event_type] += 1
+
+    async def flush(self):
+        """Dispatch every buffered event, one batch per event type"""
+        self._flush_timer.cancel()
+        buffer, self._buffer = self._buffer, {}
+        await asyncio.gather(*(
+            self._dispatch(event_type, events)
+            for event_type, events in buffer.items()
+        ))
+
+    async def close(self):
+        """Flush until the buffer stays empty, including events published by subscribers during a flush"""
+        while self._buffer or self._flush_timer.active:
+            await self._flush_timer.wait()
+            await self.flush()
+
+    async def _dispatch(self, event_type: str, events: List[IntelligenceEvent]):
+        """Deliver events to per-event subscribers and the whole list to batch subscribers"""
+        callbacks = [
+            callback(event)
+            for callback in self.subscribers.get(event_type, ())
+            for event in events
+        ]
+        callbacks.extend(callback(events) for callback in self.batch_subscribers.get(event_type, ()))
+        if not callbacks:
+            return
+
+        results = await asyncio.gather(*callbacks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in event subscriber: %s", result, exc_info=result)
+
+    def subscribe(self, event_type: Union[EventType, str], callback: Callable):
         """Subscribe to events of a specific type"""
+        event_type = _event_type_key(event_type)
         if event_type not in self.subscribers:
             self.subscribers[event_type] = []
         self.subscribers[event_type].append(callback)
 
-    def unsubscribe(self, event_type: str, callback: Callable):
+    def subscribe_many(self, handlers: Dict[Union[EventType, str], Callable]):
+        """Subscribe several callbacks at once, keyed by event type"""
+        subscribers = self.subscribers
+        for event_type, callback in handlers.items():
+            subscribers.setdefault(_event_type_key(event_type), []).append(callback)
+
+    def unsubscribe(self, event_type: Union[EventType, str], callback: Callable):
         """Unsubscribe from events"""
+        event_type = _event_type_key(event_type)
         if event_type in self.subscribers:
             self.subscribers[event_type].remove(callback)
 
+    def subscribe_batch(self, event_type: Union[EventType, str], callback: Callable):
+        """Subscribe to events of a specific type, receiving them as a list per dispatch"""
+        event_type = _event_type_key(event_type)
+        if event_type not in self.batch_subscribers:
+            self.batch_subscribers[event_type] = []
+        self.batch_subscribers[event_type].append(callback)
+
+    def unsubscribe_batch(self, event_type: Union[EventType, str], callback: Callable):
+        """Unsubscribe a batch subscriber"""
+        event_type = _event_type_key(event_type)
+        if event_type in self.batch_subscribers:
+            self.batch_subscribers[event_type].remove(callback)
+
     def get_recent_events(self, limit: int = 10) -> List[IntelligenceEvent]:
         """Get recent events for debugging/monitoring"""
-        return self.event_history[-limit:]
+        return list(islice(self.event_history, max(0, len(self.event_history) - limit), None))
 
     def get_event_stats(self) -> Dict[str, Any]:
         """Get statistics about event flow"""
-        event_counts = {}
-        for event in self.event_history:
-            event_type = event.event_type.value
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-        
         return {
             "total_events": len(self.event_history),
-            "events_by_type": event_counts,
+            "events_by_type": dict(self._type_counter),
             "active_subscribers": {
-                event_type: len(callbacks) 
-                for event_type, callbacks in self.subscribers.items()
+                event_type: len(self.subscribers.get(event_type, ())) + len(self.batch_subscribers.get(event_type, ()))
+                for event_type in self.subscribers.keys() | self.batch_subscribers.keys()
             }
         }
-    
-
-def get_event_bus() -> EventBus:
-    return EventBus()
\ No newline at end of file
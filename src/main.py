@@ -2,6 +2,13 @@ from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import asyncio
+import logging
+import os
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 from src.core.service import CoreIntelligenceService
 from src.modules.router import router as modules_router
@@ -10,7 +17,16 @@ from src.modules.task_module import TaskModule
 from src.modules.chat_module import ChatModule
 from src.modules.insight_module import InsightModule
 
-event_bus = EventBus()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger(__name__)
+
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Seconds to buffer events before dispatching them per type; unset dispatches immediately
+EVENT_BATCH_WINDOW = os.getenv("EVENT_BATCH_WINDOW")
+
+event_bus = EventBus(batch_window=float(EVENT_BATCH_WINDOW) if EVENT_BATCH_WINDOW else None)
 core_service = CoreIntelligenceService(event_bus)
 
 task_module = TaskModule(event_bus, core_service)
@@ -19,19 +35,37 @@ insight_module = InsightModule(event_bus, core_service)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Eager tasks run synchronously until their first real suspension point,
+    # so module fan-out that never blocks skips a trip through the scheduler.
+    # Only available on Python 3.12+.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    app.state.core_service = core_service
+    app.state.event_bus = event_bus
     await core_service.initialize()
     
-    await task_module.register()
-    await chat_module.register() 
-    await insight_module.register()
+    await asyncio.gather(
+        task_module.register(),
+        chat_module.register(),
+        insight_module.register()
+    )
     
     asyncio.create_task(task_module.start_listening())
     asyncio.create_task(chat_module.start_listening())
     asyncio.create_task(insight_module.start_listening())
     
-    print("Core Intelligence Service started with 3 mock modules!")
+    logger.info("Core Intelligence Service started with 3 mock modules!")
     yield
-    print("Core Intelligence Service stopped!")
+    # Deliver buffered insights and events before shutting down. In batch mode a bus
+    # flush can hand the insight module new work, so repeat until both are empty.
+    while True:
+        await insight_module.close()
+        await event_bus.close()
+        if not insight_module.has_pending_insights:
+            break
+    logger.info("Core Intelligence Service stopped!")
 
 app = FastAPI(
     title="Universal Intelligence Hub",
@@ -81,4 +115,4 @@ async def simulate_task_creation():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop" if uvloop is not None else "asyncio")
\ No newline at end of file
@@ -1,12 +1,20 @@
-from typing import Dict, Any
+from typing import Deque, Dict, Any
 from uuid import uuid4
 from datetime import datetime
 import asyncio
+import logging
+from collections import deque
+from itertools import islice
 
-from src.core.models import ModuleRegistration, IntelligenceEvent, EventType, ModuleType
-from src.core.service import CoreIntelligenceService
+from src.core.models import ModuleRegistration, IntelligenceEvent, IntelligenceResponse, EventType, ModuleType
+from src.core.service import CoreIntelligenceService, SIMULATE_LATENCY_SEC
 from src.events.bus import EventBus
 
+logger = logging.getLogger(__name__)
+
+# Messages retained per conversation
+MAX_CONVERSATION_MESSAGES = 50
+
 class ChatModule:
     """Mock Chat Module with event-based communication"""
     
@@ -16,13 +24,15 @@ class ChatModule:
         self.module_id = None
         self.name = "Smart Chat Assistant"
         self.version = "1.0.0"
-        self.conversations_db = {}
+        self.conversations_db: Dict[str, Deque[Dict[str, Any]]] = {}
         self._setup_event_handlers()
 
     def _setup_event_handlers(self):
         """Setup event handlers for this module"""
-        self.event_bus.subscribe(EventType.MESSAGE_RECEIVED, self._handle_message)
-        self.event_bus.subscribe(EventType.INTELLIGENCE_RESPONSE, self._handle_intelligence_response)
+        self.event_bus.subscribe_many({
+            EventType.MESSAGE_RECEIVED: self._handle_message,
+            EventType.INTELLIGENCE_RESPONSE: self._handle_intelligence_response,
+        })
 
     async def register(self):
         """Register this module with the core service"""
@@ -36,12 +46,12 @@ class ChatModule:
         )
         registered_module = await self.core_service.register_module(registration)
         self.module_id = registered_module.module_id
-        print(f"Chat Module registered with ID: {self.module_id}")
+        logger.info("Chat Module registered with ID: %s", self.module_id)
         return registered_module
 
     async def start_listening(self):
         """Start listening for events"""
-        print("Chat Module started listening for events...")
+        logger.info("Chat Module started listening for events...")
 
     async def send_message(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
         """Send a message and publish event"""
@@ -58,7 +68,7 @@ class ChatModule:
         }
         
         if conversation_id not in self.conversations_db:
-            self.conversations_db[conversation_id] = []
+            self.conversations_db[conversation_id] = deque(maxlen=MAX_CONVERSATION_MESSAGES)
         self.conversations_db[conversation_id].append(message)
         
         event = IntelligenceEvent(
@@ -72,22 +82,22 @@ class ChatModule:
         )
         
         await self.event_bus.publish(event)
-        print(f"Chat Module published MESSAGE_RECEIVED event: {message_id}")
+        logger.debug("Chat Module published MESSAGE_RECEIVED event: %s", message_id)
         
         return {
             "message_id": message_id,
             "conversation_id": conversation_id,
             "status": "sent",
-            "event_id": str(event.event_id)
+            "event_id": event.event_id_str
         }
 
     async def _handle_message(self, event: IntelligenceEvent):
         """Handle incoming message events"""
         if event.source_module != self.module_id:
             message_data = event.payload
-            print(f"Chat Module processing external message: {message_data.get('message_id')}")
+            logger.debug("Chat Module processing external message: %s", message_data.get('message_id'))
             
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(SIMULATE_LATENCY_SEC)
             
             response_event = IntelligenceEvent(
                 event_type=EventType.MESSAGE_SENT,
@@ -103,17 +113,18 @@ class ChatModule:
 
     async def _handle_intelligence_response(self, event: IntelligenceEvent):
         """Handle responses from core intelligence service"""
-        response_data = event.payload
-        print(f"Chat Module received intelligence response")
+        response: IntelligenceResponse = event.payload["response"]
+        logger.debug("Chat Module received intelligence response")
         
-        insights = response_data.get('core_insights', {})
+        insights = response.core_insights
         if 'synthesized_insights' in insights:
-            print(f"Chat insights: {insights['synthesized_insights']}")
+            logger.debug("Chat insights: %s", insights['synthesized_insights'])
 
     def _get_conversation_context(self, conversation_id: str) -> Dict[str, Any]:
         """Get context for a conversation"""
         if conversation_id in self.conversations_db:
-            messages = self.conversations_db[conversation_id][-5:]
+            conversation = self.conversations_db[conversation_id]
+            messages = list(islice(conversation, max(0, len(conversation) - 5), None))
             return {
                 "message_count": len(messages),
                 "recent_senders": list(set(msg['sender'] for msg in messages)),
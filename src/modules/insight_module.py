@@ -1,11 +1,17 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from uuid import uuid4
 from datetime import datetime
 import asyncio
+import logging
 
 from src.core.models import ModuleRegistration, IntelligenceEvent, EventType, ModuleType
-from src.core.service import CoreIntelligenceService
-from src.events.bus import EventBus
+from src.core.service import CoreIntelligenceService, SIMULATE_LATENCY_SEC
+from src.events.bus import EventBus, FlushTimer
+
+logger = logging.getLogger(__name__)
+
+# Seconds to coalesce generated insights before publishing them as one event
+INSIGHT_FLUSH_WINDOW = 0.05
 
 class InsightModule:
     """Mock Insight Module with event-based communication"""
@@ -17,13 +23,17 @@ class InsightModule:
         self.name = "Insight Generator"
         self.version = "2.1.0"
         self.insights_db = {}
+        self._pending_insights: List[Dict[str, Any]] = []
+        self._flush_timer = FlushTimer(self._flush_insights)
         self._setup_event_handlers()
 
     def _setup_event_handlers(self):
         """Setup event handlers for this module"""
-        self.event_bus.subscribe(EventType.TASK_CREATED, self._handle_task_event)
-        self.event_bus.subscribe(EventType.MESSAGE_RECEIVED, self._handle_message_event)
-        self.event_bus.subscribe(EventType.USER_ACTIVITY, self._handle_user_activity)
+        self.event_bus.subscribe_many({
+            EventType.TASK_CREATED: self._handle_task_event,
+            EventType.MESSAGE_RECEIVED: self._handle_message_event,
+            EventType.USER_ACTIVITY: self._handle_user_activity,
+        })
 
     async def register(self):
         """Register this module with the core service"""
@@ -37,69 +47,56 @@ class InsightModule:
         )
         registered_module = await self.core_service.register_module(registration)
         self.module_id = registered_module.module_id
-        print(f"Insight Module registered with ID: {self.module_id}")
+        logger.info("Insight Module registered with ID: %s", self.module_id)
         return registered_module
 
     async def start_listening(self):
         """Start listening for events"""
-        print("Insight Module started listening for events...")
+        logger.info("Insight Module started listening for events...")
 
     async def _handle_task_event(self, event: IntelligenceEvent):
         """Handle task-related events to generate insights"""
         task_data = event.payload
-        print(f"Insight Module analyzing task: {task_data.get('task_id')}")
+        logger.debug("Insight Module analyzing task: %s", task_data.get('task_id'))
         
-        await asyncio.sleep(0.2)
+        await asyncio.sleep(SIMULATE_LATENCY_SEC)
         
         insight_id = str(uuid4())
         insight = {
             "insight_id": insight_id,
             "type": "task_pattern",
-            "source_event": str(event.event_id),
+            "source_event": event.event_id_str,
             "patterns": ["High-priority task created", "Similar tasks completed in 2-3 hours"],
             "confidence": 0.85,
             "timestamp": datetime.now().isoformat()
         }
         self.insights_db[insight_id] = insight
-        
-        insight_event = IntelligenceEvent(
-            event_type=EventType.INSIGHT_GENERATED,
-            source_module=self.module_id,
-            payload=insight,
-            context={"original_event_id": str(event.event_id)}
-        )
-        await self.event_bus.publish(insight_event)
+        self._queue_insight(insight)
 
     async def _handle_message_event(self, event: IntelligenceEvent):
         """Handle message events to generate insights"""
         message_data = event.payload
-        print(f"Insight Module analyzing message: {message_data.get('message_id')}")
+        logger.debug("Insight Module analyzing message: %s", message_data.get('message_id'))
         
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(SIMULATE_LATENCY_SEC)
         
         insight_id = str(uuid4())
         insight = {
             "insight_id": insight_id,
             "type": "communication_pattern",
-            "source_event": str(event.event_id),
+            "source_event": event.event_id_str,
             "patterns": ["User seeking assistance", "Common support topic"],
             "sentiment": "neutral",
             "confidence": 0.78,
             "timestamp": datetime.now().isoformat()
         }
         self.insights_db[insight_id] = insight
-        
-        insight_event = IntelligenceEvent(
-            event_type=EventType.INSIGHT_GENERATED,
-            source_module=self.module_id,
-            payload=insight
-        )
-        await self.event_bus.publish(insight_event)
+        self._queue_insight(insight)
 
     async def _handle_user_activity(self, event: IntelligenceEvent):
         """Handle user activity events"""
         activity_data = event.payload
-        print(f"Insight Module analyzing user activity: {activity_data.get('user_id')}")
+        logger.debug("Insight Module analyzing user activity: %s", activity_data.get('user_id'))
         
         insight_id = str(uuid4())
         insight = {
@@ -112,23 +109,47 @@ class InsightModule:
             "timestamp": datetime.now().isoformat()
         }
         self.insights_db[insight_id] = insight
-        
-        insight_event = IntelligenceEvent(
+        self._queue_insight(insight)
+
+    def _queue_insight(self, insight: Dict[str, Any]):
+        """Buffer an insight and schedule a flush if one is not already pending"""
+        self._pending_insights.append(insight)
+        self._flush_timer.schedule(INSIGHT_FLUSH_WINDOW)
+
+    @property
+    def has_pending_insights(self) -> bool:
+        """Whether insights are waiting in the coalescing buffer"""
+        return bool(self._pending_insights)
+
+    async def close(self):
+        """Publish any insights still waiting in the coalescing buffer"""
+        self._flush_timer.cancel()
+        await self._flush_timer.wait()
+        await self._flush_insights()
+
+    async def _flush_insights(self):
+        """Publish all buffered insights as a single INSIGHT_GENERATED event"""
+        insights, self._pending_insights = self._pending_insights, []
+        if not insights:
+            return
+
+        insight_event = IntelligenceEvent.model_construct(
             event_type=EventType.INSIGHT_GENERATED,
             source_module=self.module_id,
-            payload=insight
+            payload={"type": "insight_batch", "insights": insights}
         )
         await self.event_bus.publish(insight_event)
 
     def get_insight_stats(self) -> Dict[str, Any]:
         """Get module statistics"""
+        insights_db = self.insights_db
         insight_types = {}
-        for insight in self.insights_db.values():
+        for insight in insights_db.values():
             insight_type = insight.get('type', 'unknown')
             insight_types[insight_type] = insight_types.get(insight_type, 0) + 1
             
         return {
-            "total_insights": len(self.insights_db),
+            "total_insights": len(insights_db),
             "insights_by_type": insight_types,
             "module_id": str(self.module_id),
             "module_name": self.name
@@ -1,29 +1,43 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 import asyncio
+import logging
+from collections import Counter, OrderedDict
 
-from src.core.models import ModuleRegistration, IntelligenceEvent, EventType, ModuleType
-from src.core.service import CoreIntelligenceService
+from src.core.models import ModuleRegistration, IntelligenceEvent, IntelligenceResponse, EventType, ModuleType
+from src.core.service import CoreIntelligenceService, SIMULATE_LATENCY_SEC
 from src.events.bus import EventBus
 
+logger = logging.getLogger(__name__)
+
+# Oldest TASK_CREATED events still awaiting a core response are dropped past this
+MAX_PENDING_TASK_EVENTS = 1000
+
 class TaskModule:
     """Mock Task Management Module with event-based communication"""
     
-    def __init__(self, event_bus: EventBus, core_service: CoreIntelligenceService):
+    def __init__(self, event_bus: EventBus, core_service: CoreIntelligenceService, simulate_latency: float = SIMULATE_LATENCY_SEC):
         self.event_bus = event_bus
         self.core_service = core_service
+        # Mock processing delay in seconds for external task handling; defaults to SIM_LATENCY
+        self.simulate_latency = simulate_latency
         self.module_id = None
         self.name = "Task Intelligence Engine"
         self.version = "1.2.0"
         self.tasks_db = {}
+        self._priority_counts: Counter = Counter()
+        # TASK_CREATED event id -> task id, until the core's response for that event arrives
+        self._event_to_task: OrderedDict[UUID, str] = OrderedDict()
         self._setup_event_handlers()
 
     def _setup_event_handlers(self):
         """Setup event handlers for this module"""
-        self.event_bus.subscribe(EventType.TASK_CREATED, self._handle_task_created)
-        self.event_bus.subscribe(EventType.INTELLIGENCE_RESPONSE, self._handle_intelligence_response)
-        self.event_bus.subscribe("task_analysis_complete", self._handle_task_analysis)
+        self.event_bus.subscribe_many({
+            EventType.TASK_CREATED: self._handle_task_created,
+            EventType.INTELLIGENCE_RESPONSE: self._handle_intelligence_response,
+            "task_analysis_complete": self._handle_task_analysis,
+        })
 
     async def register(self):
         """Register this module with the core service"""
@@ -37,16 +51,34 @@ class TaskModule:
         )
         registered_module = await self.core_service.register_module(registration)
         self.module_id = registered_module.module_id
-        print(f"Task Module registered with ID: {self.module_id}")
+        logger.info("Task Module registered with ID: %s", self.module_id)
         return registered_module
 
     async def start_listening(self):
         """Start listening for events (mock background process)"""
-        print("Task Module started listening for events...")
+        logger.info("Task Module started listening for events...")
         # In a real implementation, this would be a proper message consumer
 
     async def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new task and publish event (simulating internal module operation)"""
+        task_id, event = self._build_task(task_data)
+        
+        await self.event_bus.publish(event)
+        logger.debug("Task Module published TASK_CREATED event for task: %s", task_id)
+        
+        return self._task_created_result(task_id, event)
+
+    async def create_tasks(self, tasks_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several tasks and publish all their events in one bus call"""
+        built = [self._build_task(task_data) for task_data in tasks_data]
+        
+        await self.event_bus.publish_many([event for _, event in built])
+        logger.debug("Task Module published %d TASK_CREATED events", len(built))
+        
+        return [self._task_created_result(task_id, event) for task_id, event in built]
+
+    def _build_task(self, task_data: Dict[str, Any]) -> Tuple[str, IntelligenceEvent]:
+        """Store a new task and build its TASK_CREATED event"""
         task_id = str(uuid4())
         
         task = {
@@ -59,6 +91,7 @@ class TaskModule:
             "user_id": task_data.get("user_id", "unknown")
         }
         self.tasks_db[task_id] = task
+        self._priority_counts[task["priority"]] += 1
         
         event = IntelligenceEvent(
             event_type=EventType.TASK_CREATED,
@@ -69,24 +102,29 @@ class TaskModule:
                 "source": "task_module"
             }
         )
-        
-        await self.event_bus.publish(event)
-        print(f" Task Module published TASK_CREATED event for task: {task_id}")
-        
+        event_to_task = self._event_to_task
+        event_to_task[event.event_id] = task_id
+        # A failed core dispatch never sends a response, so its entry would otherwise linger
+        if len(event_to_task) > MAX_PENDING_TASK_EVENTS:
+            event_to_task.popitem(last=False)
+        return task_id, event
+
+    def _task_created_result(self, task_id: str, event: IntelligenceEvent) -> Dict[str, Any]:
+        """Build the API result for a created task"""
         return {
             "task_id": task_id,
             "status": "created",
             "message": "Task created and event published",
-            "event_id": str(event.event_id)
+            "event_id": event.event_id_str
         }
 
     async def _handle_task_created(self, event: IntelligenceEvent):
         """Handle task creation events (even from other modules)"""
         if event.source_module != self.module_id:
             task_data = event.payload
-            print(f"🔄 Task Module processing external task: {task_data.get('task_id')}")
+            logger.debug("Task Module processing external task: %s", task_data.get('task_id'))
             
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(self.simulate_latency)
             
             analysis_event = IntelligenceEvent(
                 event_type=EventType.INSIGHT_GENERATED,
@@ -97,21 +135,25 @@ class TaskModule:
                     "insights": ["Task complexity: medium", "Estimated completion: 2 hours"],
                     "recommendations": ["Break into subtasks", "Set reminder for follow-up"]
                 },
-                context={"original_event_id": str(event.event_id)}
+                context={"original_event_id": event.event_id_str}
             )
             await self.event_bus.publish(analysis_event)
 
     async def _handle_intelligence_response(self, event: IntelligenceEvent):
         """Handle responses from core intelligence service"""
-        response_data = event.payload
-        original_event_id = response_data.get("original_event_id")
+        response: IntelligenceResponse = event.payload["response"]
+        original_event_id = response.request_id
+        
+        logger.debug("Task Module received intelligence response for event %s", original_event_id)
+        logger.debug("Core insights: %s", response.core_insights)
         
-        print(f"Task Module received intelligence response for event {original_event_id}")
-        print(f"Core insights: {response_data.get('core_insights', {})}")
+        task_id = self._event_to_task.pop(original_event_id, None)
+        if task_id is None:
+            return
         
-        for task_id in self.tasks_db:
-            if "task_analysis" in str(response_data.get('core_insights', {})):
-                self.tasks_db[task_id]["last_insights"] = response_data.get('core_insights')
+        core_insights = response.core_insights
+        if "task_analysis" in repr(core_insights):
+            self.tasks_db[task_id]["last_insights"] = core_insights
 
     async def _handle_task_analysis(self, event: IntelligenceEvent):
         """Handle custom task analysis events"""
@@ -120,16 +162,16 @@ class TaskModule:
         
         if task_id in self.tasks_db:
             self.tasks_db[task_id]["analysis"] = analysis_data
-            print(f"Task Module updated analysis for task: {task_id}")
+            logger.debug("Task Module updated analysis for task: %s", task_id)
 
     def get_task_stats(self) -> Dict[str, Any]:
         """Get module statistics"""
+        priority_counts = self._priority_counts
         return {
             "total_tasks": len(self.tasks_db),
             "tasks_by_priority": {
-                "high": len([t for t in self.tasks_db.values() if t.get("priority") == "high"]),
-                "medium": len([t for t in self.tasks_db.values() if t.get("priority") == "medium"]),
-                "low": len([t for t in self.tasks_db.values() if t.get("priority") == "low"])
+                priority: priority_counts[priority]
+                for priority in ("high", "medium", "low")
             },
             "module_id": str(self.module_id),
             "module_name": self.name
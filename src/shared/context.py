@@ -1,108 +1,159 @@
-from typing import Dict, Any, List
+from typing import Collection, Deque, Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
-from src.core.models import IntelligenceEvent
+from collections import Counter, OrderedDict, defaultdict, deque
+from itertools import count, islice
+from src.core.models import IntelligenceEvent, EventType
+
+_ACTIVE_STATUSES = frozenset({'pending', 'in_progress'})
+
+# Every field get_relevant_context can build, in the order it returns them
+CONTEXT_FIELDS = ('recent_conversations', 'active_tasks', 'recent_insights', 'user_behavior')
 
 class SharedContext:
     """Manages shared intelligence context across modules"""
     
     def __init__(self):
         self.user_profiles: Dict[str, Any] = {}
-        self.conversation_history: List[Dict] = []
+        self.conversation_history: Deque[Dict] = deque(maxlen=100)
         self.task_context: Dict[str, Any] = {}
-        self.insight_cache: Dict[str, Any] = {}
-        self.behavior_patterns: Dict[str, Any] = {}
+        self._active_task_ids: Set[str] = set()
+        # Insertion-ordered, so the oldest entries are always at the front
+        self.insight_cache: OrderedDict[str, Any] = OrderedDict()
+        self._insight_sequence = count()
+        self.behavior_patterns: defaultdict[str, Counter] = defaultdict(Counter)
         self.last_updated = datetime.now()
 
     def update_from_event(self, event: IntelligenceEvent):
         """Update shared context based on incoming events"""
-        self.last_updated = datetime.now()
+        now = datetime.now()
+        self.last_updated = now
         
-        if event.event_type.value.startswith('task_'):
-            self._update_task_context(event)
-        elif event.event_type.value.startswith('message_'):
-            self._update_conversation_context(event)
-        elif event.event_type.value == 'user_activity':
-            self._update_user_behavior(event)
-        elif event.event_type.value == 'insight_generated':
-            self._update_insight_cache(event)
-
-    def _update_task_context(self, event: IntelligenceEvent):
+        handler = self._EVENT_UPDATERS.get(event.event_type)
+        if handler:
+            handler(self, event, now)
+
+    def _update_task_context(self, event: IntelligenceEvent, now: datetime):
         """Update task-related context"""
         task_id = event.payload.get('task_id', 'unknown')
-        if task_id not in self.task_context:
-            self.task_context[task_id] = {}
+        task = self.task_context.setdefault(task_id, {})
         
-        self.task_context[task_id].update({
-            'last_activity': datetime.now(),
-            'status': event.payload.get('status', 'unknown'),
-            **event.payload
-        })
+        task.update(event.payload)
+        task['last_activity'] = now
+        task['status'] = event.payload.get('status', task.get('status', 'unknown'))
+        
+        if task['status'] in _ACTIVE_STATUSES:
+            self._active_task_ids.add(task_id)
+        else:
+            self._active_task_ids.discard(task_id)
 
-    def _update_conversation_context(self, event: IntelligenceEvent):
+    def _update_conversation_context(self, event: IntelligenceEvent, now: datetime):
         """Update conversation history and context"""
         conversation_entry = {
-            'timestamp': datetime.now(),
+            'timestamp': now,
             'event_type': event.event_type.value,
-            'source': str(event.source_module),
+            'source': event.source_module_str,
             'content': event.payload.get('content', ''),
             'metadata': event.payload.get('metadata', {})
         }
         self.conversation_history.append(conversation_entry)
-        
-        if len(self.conversation_history) > 100:
-            self.conversation_history.pop(0)
 
-    def _update_user_behavior(self, event: IntelligenceEvent):
+    def _update_user_behavior(self, event: IntelligenceEvent, now: datetime):
         """Update user behavior patterns"""
         user_id = event.payload.get('user_id', 'default')
         activity_type = event.payload.get('activity_type', 'unknown')
-        
-        if user_id not in self.behavior_patterns:
-            self.behavior_patterns[user_id] = {}
-        
-        if activity_type not in self.behavior_patterns[user_id]:
-            self.behavior_patterns[user_id][activity_type] = 0
-        
         self.behavior_patterns[user_id][activity_type] += 1
 
-    def _update_insight_cache(self, event: IntelligenceEvent):
+    def _update_insight_cache(self, event: IntelligenceEvent, now: datetime):
         """Cache generated insights for future reference"""
-        insight_key = f"{event.source_module}_{datetime.now().timestamp()}"
-        self.insight_cache[insight_key] = {
-            'insight': event.payload.get('insight', {}),
-            'timestamp': datetime.now(),
-            'source_module': event.source_module
-        }
-        
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        self.insight_cache = {
-            k: v for k, v in self.insight_cache.items() 
-            if v['timestamp'] > cutoff_time
-        }
+        if event.payload.get('type') == 'insight_batch':
+            insights = event.payload.get('insights', [])
+        else:
+            insights = [event.payload.get('insight', {})]
 
-    def get_relevant_context(self, event: IntelligenceEvent) -> Dict[str, Any]:
-        """Get context relevant to the current event"""
-        relevant_context = {
-            'recent_conversations': self.conversation_history[-5:],
-            'active_tasks': {
-                k: v for k, v in self.task_context.items() 
-                if v.get('status') in ['pending', 'in_progress']
-            },
-            'recent_insights': list(self.insight_cache.values())[-3:],
-        }
+        insight_cache = self.insight_cache
+        for insight in insights:
+            insight_key = insight.get('insight_id') or f"{event.source_module}_{next(self._insight_sequence)}"
+            insight_cache[insight_key] = {
+                'insight': insight,
+                'timestamp': now,
+                'source_module': event.source_module
+            }
+            insight_cache.move_to_end(insight_key)
         
+        cutoff_time = now - timedelta(hours=1)
+        while insight_cache and next(iter(insight_cache.values()))['timestamp'] <= cutoff_time:
+            insight_cache.popitem(last=False)
+
+    _EVENT_UPDATERS = {
+        EventType.TASK_CREATED: _update_task_context,
+        EventType.TASK_UPDATED: _update_task_context,
+        EventType.TASK_COMPLETED: _update_task_context,
+        EventType.MESSAGE_RECEIVED: _update_conversation_context,
+        EventType.MESSAGE_SENT: _update_conversation_context,
+        EventType.USER_ACTIVITY: _update_user_behavior,
+        EventType.INSIGHT_GENERATED: _update_insight_cache,
+    }
+
+    def _build_recent_conversations(self, event: IntelligenceEvent) -> List[Dict]:
+        history = self.conversation_history
+        return list(islice(history, max(0, len(history) - 5), None))
+
+    def _build_active_tasks(self, event: IntelligenceEvent) -> Dict[str, Any]:
+        task_context = self.task_context
+        return {task_id: task_context[task_id] for task_id in self._active_task_ids}
+
+    def _build_recent_insights(self, event: IntelligenceEvent) -> List[Any]:
+        # Walk from the newest end so only three entries are touched, then restore oldest-first order
+        return list(islice(reversed(self.insight_cache.values()), 3))[::-1]
+
+    def _build_user_behavior(self, event: IntelligenceEvent) -> Counter:
+        return self.behavior_patterns[event.payload.get('user_id')]
+
+    def _has_user_behavior(self, event: IntelligenceEvent) -> bool:
         user_id = event.payload.get('user_id')
-        if user_id and user_id in self.behavior_patterns:
-            relevant_context['user_behavior'] = self.behavior_patterns[user_id]
-        
-        return relevant_context
+        return bool(user_id) and user_id in self.behavior_patterns
+
+    _CONTEXT_BUILDERS = {
+        'recent_conversations': _build_recent_conversations,
+        'active_tasks': _build_active_tasks,
+        'recent_insights': _build_recent_insights,
+        'user_behavior': _build_user_behavior,
+    }
+
+    # Fields that are only present when their check passes; the rest are always returned
+    _CONTEXT_CONDITIONS = {
+        'user_behavior': _has_user_behavior,
+    }
+
+    def get_relevant_context(self, event: IntelligenceEvent, fields: Collection[str] = CONTEXT_FIELDS) -> Dict[str, Any]:
+        """Get context relevant to the current event, building only the requested fields"""
+        builders = self._CONTEXT_BUILDERS
+        return {
+            field: builders[field](self, event)
+            for field in self.get_relevant_context_fields(event, fields)
+        }
+
+    def get_relevant_context_fields(self, event: IntelligenceEvent, fields: Collection[str] = CONTEXT_FIELDS,
+                                    limit: Optional[int] = None) -> List[str]:
+        """Names of the fields get_relevant_context would return for this event, in order, without building them"""
+        conditions = self._CONTEXT_CONDITIONS
+        names = []
+        for field in CONTEXT_FIELDS:
+            if len(names) == limit:
+                break
+            if field not in fields:
+                continue
+            condition = conditions.get(field)
+            if condition is None or condition(self, event):
+                names.append(field)
+        return names
 
     def get_context_stats(self) -> Dict[str, Any]:
         """Get statistics about the shared context"""
         return {
             'total_conversations': len(self.conversation_history),
-            'active_tasks': len([t for t in self.task_context.values() if t.get('status') in ['pending', 'in_progress']]),
+            'active_tasks': len(self._active_task_ids),
             'cached_insights': len(self.insight_cache),
             'tracked_users': len(self.behavior_patterns),
-            'last_updated': self.last_updated.isoformat()
+            'last_updated': self.last_updated
         }
\ No newline at end of file
@@ -1,47 +1,55 @@
 import asyncio
-import requests
+import httpx
 import json
 from uuid import uuid4
 
-BASE_URL = "http://localhost:8000/api/v1"
+HOST_URL = "http://localhost:8000"
+API_PREFIX = "/api/v1"
 
-def test_event_based_flow():
+async def run_event_based_flow():
     """Test the event-based intelligence hub"""
     
     print("🚀 Testing Event-Based Universal Intelligence Hub\n")
     
-    # 1. Check health
-    print("1. Checking service health...")
-    response = requests.get("http://localhost:8000/health")
-    print(f"   Health: {response.json()}\n")
-    
-    # 2. Get module statistics
-    print("2. Checking module registrations...")
-    response = requests.get(f"{BASE_URL}/modules/stats")
-    stats = response.json()
-    print(f"   Module Stats: {stats}\n")
-    
-    # 3. Simulate task creation (triggers event flow)
-    print("3. Simulating task creation event...")
-    response = requests.post("http://localhost:8000/simulate/task-creation")
-    result = response.json()
-    print(f"   Task Creation Result: {result}\n")
+    # One client for the whole run so every request reuses the same connection pool
+    async with httpx.AsyncClient(base_url=HOST_URL) as client:
+        # 1-2. Health and module registrations are independent, so fetch them together
+        health_response, stats_response = await asyncio.gather(
+            client.get("/health"),
+            client.get(f"{API_PREFIX}/modules/stats")
+        )
+        
+        print("1. Checking service health...")
+        print(f"   Health: {health_response.json()}\n")
+        
+        print("2. Checking module registrations...")
+        stats = stats_response.json()
+        print(f"   Module Stats: {stats}\n")
+        
+        # 3. Simulate task creation (triggers event flow); must finish before the reads below
+        print("3. Simulating task creation event...")
+        response = await client.post("/simulate/task-creation")
+        result = response.json()
+        print(f"   Task Creation Result: {result}\n")
+        
+        event_response, context_response, modules_response = await asyncio.gather(
+            client.get(f"{API_PREFIX}/events/stats"),
+            client.get(f"{API_PREFIX}/context/stats"),
+            client.get(f"{API_PREFIX}/modules")
+        )
     
     # 4. Check event statistics
     print("4. Checking event flow statistics...")
-    response = requests.get(f"{BASE_URL}/events/stats")
-    event_stats = response.json()
+    event_stats = event_response.json()
     print(f"   Event Stats: {event_stats}\n")
     
     # 5. Check context statistics
     print("5. Checking shared context...")
-    response = requests.get(f"{BASE_URL}/context/stats")
-    context_stats = response.json()
+    context_stats = context_response.json()
     print(f"   Context Stats: {context_stats}\n")
     
     # 6. Check individual module stats
     print("6. Checking individual module states...")
-    modules_response = requests.get(f"{BASE_URL}/modules")
     modules = modules_response.json()
     print(f"   Registered Modules:")
     for module in modules:
@@ -49,5 +57,8 @@ def test_event_based_flow():
     
     print("\n✅ Event flow test completed! Check logs for event processing details.")
 
+def run_manual_flow():
+    asyncio.run(run_event_based_flow())
+
 if __name__ == "__main__":
-    test_event_based_flow()
\ No newline at end of file
+    run_manual_flow()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import asyncio
+from uuid import uuid4
+
+from src.core.models import IntelligenceEvent, EventType
+from src.events.bus import EventBus
+
+
+def _task_created_event() -> IntelligenceEvent:
+    return IntelligenceEvent(
+        event_type=EventType.TASK_CREATED,
+        source_module=uuid4(),
+        payload={"title": "Test"}
+    )
+
+
+def _publish(bus: EventBus, event: IntelligenceEvent):
+    asyncio.run(bus.publish(event))
+
+
+def test_enum_subscription_receives_published_event():
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    bus.subscribe(EventType.TASK_CREATED, handler)
+    event = _task_created_event()
+    _publish(bus, event)
+
+    assert received == [event]
+
+
+def test_string_subscription_receives_published_event():
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    bus.subscribe("task_created", handler)
+    event = _task_created_event()
+    _publish(bus, event)
+
+    assert received == [event]
+
+
+def test_enum_and_string_keys_share_subscriber_list():
+    bus = EventBus()
+
+    async def handler(event):
+        pass
+
+    bus.subscribe(EventType.TASK_CREATED, handler)
+    bus.subscribe("task_created", handler)
+
+    assert list(bus.subscribers) == ["task_created"]
+    assert len(bus.subscribers["task_created"]) == 2
+
+
+def test_unsubscribe_with_enum_stops_delivery():
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    bus.subscribe("task_created", handler)
+    bus.unsubscribe(EventType.TASK_CREATED, handler)
+    _publish(bus, _task_created_event())
+
+    assert received == []
+
+
+def test_unsubscribe_with_string_stops_delivery():
+    bus = EventBus()
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    bus.subscribe(EventType.TASK_CREATED, handler)
+    bus.unsubscribe("task_created", handler)
+    _publish(bus, _task_created_event())
+
+    assert received == []
+
+
+def test_concurrent_publishers_each_deliver_their_own_event():
+    bus = EventBus()
+    delivered = []
+
+    async def slow_handler(event):
+        await asyncio.sleep(0.05)
+        delivered.append(event.event_id)
+
+    bus.subscribe(EventType.TASK_CREATED, slow_handler)
+
+    async def publish_and_check(event):
+        await bus.publish(event)
+        # publish only returns once this caller's event has been delivered
+        assert event.event_id in delivered
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(publish_and_check(_task_created_event()) for _ in range(4)))
+        return loop.time() - started
+
+    elapsed = asyncio.run(main())
+
+    assert len(delivered) == 4
+    # Independent publishers dispatch concurrently rather than one after another
+    assert elapsed < 0.15
+
+
+def test_publish_from_subscriber_is_delivered_before_outer_publish_returns():
+    bus = EventBus()
+    received = []
+
+    async def on_task(event):
+        received.append(event.event_type)
+        await bus.publish(IntelligenceEvent(
+            event_type=EventType.INSIGHT_GENERATED,
+            source_module=event.source_module,
+            payload={}
+        ))
+        # Nested publishes are deferred, not dispatched inside this subscriber
+        assert received == [EventType.TASK_CREATED]
+
+    async def on_insight(event):
+        received.append(event.event_type)
+
+    bus.subscribe(EventType.TASK_CREATED, on_task)
+    bus.subscribe(EventType.INSIGHT_GENERATED, on_insight)
+    _publish(bus, _task_created_event())
+
+    assert received == [EventType.TASK_CREATED, EventType.INSIGHT_GENERATED]